@@ -240,6 +240,7 @@ def demonstrate_error_handling():
     # Test invalid model
     try:
         chat = create_chat_client('invalid-model')
+        chat.model_config  # configuration is resolved on first use
     except ValueError as e:
         print(f"✅ Caught expected error for invalid model: {e}")
     
@@ -257,7 +258,8 @@ def main():
     print("LLM Chat System - Comprehensive Example")
     print("=" * 50)
     
-    # Check environment
+    # Check environment (creating the configuration loads .env)
+    get_config()
     required_vars = ['ABACUS_DEPLOYMENT_ID']
     auth_vars = ['ABACUS_API_KEY', 'ABACUS_DEPLOYMENT_TOKEN']
     
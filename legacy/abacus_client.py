@@ -18,6 +18,8 @@ class AbacusAPIClient:
     
     def __init__(self):
         self.auth_config = get_auth_config()
+        # Shared session so keep-alive reuses the TLS connection across requests
+        self.session = requests.Session()
     
     def send_chat_request(self,
                          messages: List[Dict[str, Any]],
@@ -63,7 +65,7 @@ class AbacusAPIClient:
             payload["deploymentToken"] = token
         
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            response = self.session.post(url, headers=headers, json=payload)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -107,7 +109,7 @@ class AbacusAPIClient:
             payload["deploymentToken"] = token
         
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            response = self.session.post(url, headers=headers, json=payload)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -157,7 +159,7 @@ class AbacusAPIClient:
                 if token:
                     data['deploymentToken'] = token
                 
-                response = requests.post(url, headers=headers, files=files, data=data)
+                response = self.session.post(url, headers=headers, files=files, data=data)
                 response.raise_for_status()
                 
                 result = response.json()
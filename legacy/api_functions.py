@@ -11,6 +11,23 @@ from .abacus_client import get_client
 from .file_operations import FileProcessor
 
 
+class _LazyClient:
+    """
+    Module-level stand-in for the global API client
+
+    Resolves get_client() on first attribute access and caches the looked-up
+    attribute on the proxy, so later calls are a plain instance-dict hit.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(get_client(), name)
+        setattr(self, name, value)
+        return value
+
+
+_client = _LazyClient()
+
+
 def send_json_to_gpt5(json_file_path: str, 
                      prompt: str, 
                      deployment_token: Optional[str] = None, 
@@ -40,8 +57,7 @@ def send_json_to_gpt5(json_file_path: str,
     }]
     
     # Send to API
-    client = get_client()
-    return client.send_chat_request(
+    return _client.send_chat_request(
         messages=messages,
         deployment_token=deployment_token,
         deployment_id=deployment_id,
@@ -77,8 +93,7 @@ def send_json_content_to_gpt5(json_content: Dict[str, Any],
     }]
     
     # Send to API
-    client = get_client()
-    return client.send_chat_request(
+    return _client.send_chat_request(
         messages=messages,
         deployment_token=deployment_token,
         deployment_id=deployment_id,
@@ -113,8 +128,7 @@ def send_json_to_llm_completion(json_file_path: str,
     full_prompt = f"{prompt}\n\nJSON Data:\n{json.dumps(json_data, indent=2)}"
     
     # Send to completion API
-    client = get_client()
-    return client.send_completion_request(
+    return _client.send_completion_request(
         prompt=full_prompt,
         deployment_token=deployment_token,
         deployment_id=deployment_id,
@@ -138,8 +152,7 @@ def upload_file_to_abacus(file_path: str,
     Returns:
         File ID for use in chat messages
     """
-    client = get_client()
-    return client.upload_file(
+    return _client.upload_file(
         file_path=file_path,
         deployment_token=deployment_token,
         deployment_id=deployment_id,
@@ -178,8 +191,7 @@ def send_chat_with_attachments(prompt: str,
     messages = [message]
     
     # Send to API
-    client = get_client()
-    return client.send_chat_request(
+    return _client.send_chat_request(
         messages=messages,
         deployment_token=deployment_token,
         deployment_id=deployment_id,
@@ -6,6 +6,7 @@ and configuration management for the legacy SendToLLM system.
 """
 
 import os
+from dataclasses import dataclass, field
 from dotenv import load_dotenv
 from typing import Optional, Tuple
 
@@ -13,13 +14,32 @@ from typing import Optional, Tuple
 load_dotenv()
 
 
+@dataclass(frozen=True, slots=True)
 class AbacusAuthConfig:
-    """Manages authentication and configuration for Abacus.AI API"""
+    """
+    Manages authentication and configuration for Abacus.AI API
+    
+    Use from_env() to populate the credentials from ABACUS_* environment variables.
+    """
+    
+    deployment_token: Optional[str] = field(default=None, repr=False)
+    deployment_id: Optional[str] = None
+    api_key: Optional[str] = field(default=None, repr=False)
     
-    def __init__(self):
-        self.deployment_token = os.getenv('ABACUS_DEPLOYMENT_TOKEN')
-        self.deployment_id = os.getenv('ABACUS_DEPLOYMENT_ID')
-        self.api_key = os.getenv('ABACUS_API_KEY')
+    @classmethod
+    def from_env(cls) -> 'AbacusAuthConfig':
+        """
+        Build a configuration from the current environment in one pass
+        
+        Returns:
+            AbacusAuthConfig populated from ABACUS_* environment variables
+        """
+        env = os.environ
+        return cls(
+            env.get('ABACUS_DEPLOYMENT_TOKEN'),
+            env.get('ABACUS_DEPLOYMENT_ID'),
+            env.get('ABACUS_API_KEY')
+        )
     
     def get_credentials(self, 
                        deployment_token: Optional[str] = None,
@@ -66,11 +86,7 @@ class AbacusAuthConfig:
         Returns:
             True if credentials are valid, False otherwise
         """
-        try:
-            self.get_credentials()
-            return True
-        except ValueError:
-            return False
+        return bool((self.deployment_token or self.api_key) and self.deployment_id)
     
     def get_headers(self, api_key: Optional[str] = None) -> dict:
         """
@@ -92,7 +108,7 @@ class AbacusAuthConfig:
 
 
 # Global configuration instance
-auth_config = AbacusAuthConfig()
+auth_config = AbacusAuthConfig.from_env()
 
 
 def get_auth_config() -> AbacusAuthConfig:
@@ -7,12 +7,114 @@ operations for the medical correlation analysis workflow.
 
 import json
 import os
-from typing import Dict, Any, Optional, List, Union
+import re
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Union, Callable, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional accelerator, stdlib json is used otherwise
+    orjson = None
+
+
+class _NonFiniteFloat(float):
+    """NaN/Infinity from stdlib json; orjson refuses to encode it, so writers fall back to stdlib"""
+
+
+# orjson silently turns integers wider than 64 bits into floats, so any
+# document with a digit run this long is parsed by stdlib json instead
+_WIDE_INT_RE = re.compile(r'[0-9]{19}')
+_WIDE_INT_BYTES_RE = re.compile(rb'[0-9]{19}')
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON with orjson only when it yields exactly what stdlib json would
+    
+    Documents that may hold integers beyond 64 bits, or that orjson rejects
+    (NaN/Infinity), go through stdlib json and parse as they always have.
+    """
+    if orjson is not None:
+        wide_int_re = _WIDE_INT_RE if isinstance(data, str) else _WIDE_INT_BYTES_RE
+        if wide_int_re.search(data) is None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data, parse_constant=_NonFiniteFloat)
+
+
+# Parsed file contents keyed by (path, reader name) -> (mtime_ns, content), least recently used first.
+# Bounded so batch runs over many case directories don't keep every case's attachments alive.
+_PARSED_CACHE_SIZE = 8
+_parsed_cache: "OrderedDict[Tuple[str, str], Tuple[int, Any]]" = OrderedDict()
+_parsed_cache_lock = threading.Lock()
 
 
 class FileProcessor:
     """Handles file operations for the legacy system"""
     
+    @staticmethod
+    def _read_cached(file_path: str, reader: Callable[[str], Any]) -> Any:
+        """
+        Read a file through reader, reusing the parsed result while the file is unchanged
+        
+        Args:
+            file_path: Path to the file
+            reader: Uncached reader used on a cache miss
+            
+        Returns:
+            Parsed file contents (shared between callers - do not mutate)
+        """
+        try:
+            mtime = os.stat(file_path).st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        key = (file_path, reader.__name__)
+        with _parsed_cache_lock:
+            cached = _parsed_cache.get(key)
+            if cached is not None and cached[0] == mtime:
+                _parsed_cache.move_to_end(key)
+                return cached[1]
+        
+        # Parse outside the lock so attachments loaded in parallel don't serialize
+        content = reader(file_path)
+        with _parsed_cache_lock:
+            _parsed_cache[key] = (mtime, content)
+            _parsed_cache.move_to_end(key)
+            while len(_parsed_cache) > _PARSED_CACHE_SIZE:
+                _parsed_cache.popitem(last=False)
+        return content
+    
+    @staticmethod
+    def read_json_file_cached(file_path: str) -> Dict[str, Any]:
+        """
+        Read and parse a JSON file, skipping the parse if it is unchanged since the last read
+        
+        Args:
+            file_path: Path to the JSON file
+            
+        Returns:
+            Parsed JSON data as dictionary (shared between callers - do not mutate)
+        """
+        return FileProcessor._read_cached(file_path, FileProcessor.read_json_file)
+    
+    @staticmethod
+    def read_text_file_cached(file_path: str) -> str:
+        """
+        Read a text file, skipping the read if it is unchanged since the last call
+        
+        Args:
+            file_path: Path to the text file
+            
+        Returns:
+            File contents as string
+        """
+        return FileProcessor._read_cached(file_path, FileProcessor.read_text_file)
+    
     @staticmethod
     def read_json_file(file_path: str) -> Dict[str, Any]:
         """
@@ -29,11 +131,12 @@ class FileProcessor:
             ValueError: If JSON is invalid
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                return json.load(file)
+            # Both loaders accept the raw bytes, so no text decoding pass is needed
+            with open(file_path, 'rb') as file:
+                return _json_loads(file.read())
         except FileNotFoundError:
             raise FileNotFoundError(f"JSON file not found: {file_path}")
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError is a subclass
             raise ValueError(f"Invalid JSON file: {e}")
     
     @staticmethod
@@ -81,6 +184,33 @@ class FileProcessor:
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         with open(file_path, 'w', encoding='utf-8') as file:
             file.write(content)
+    
+    @staticmethod
+    def write_bytes_file(file_path: str, content: bytes) -> None:
+        """
+        Write already-encoded content to a file
+        
+        Args:
+            file_path: Path to write the file
+            content: Bytes to write
+        """
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, 'wb') as file:
+            file.write(content)
+    
+    @staticmethod
+    def write_text_or_bytes(file_path: str, content: Union[str, bytes]) -> None:
+        """
+        Write text, or UTF-8 bytes that were encoded once by the caller
+        
+        Args:
+            file_path: Path to write the file
+            content: Text or bytes to write
+        """
+        if isinstance(content, bytes):
+            FileProcessor.write_bytes_file(file_path, content)
+        else:
+            FileProcessor.write_text_file(file_path, content)
 
 
 class MedicalFileValidator:
@@ -101,11 +231,12 @@ class MedicalFileValidator:
         Raises:
             FileNotFoundError: If attachments directory doesn't exist
         """
-        if not os.path.exists(attachments_dir):
-            raise FileNotFoundError(f"Attachments directory not found: {attachments_dir}")
-
-        # Get all files in the directory
-        all_files = os.listdir(attachments_dir)
+        # One directory scan; is_file() normally answers from the directory entry type without a stat
+        try:
+            with os.scandir(attachments_dir) as it:
+                all_files = [entry.name for entry in it if entry.is_file()]
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Attachments directory not found: {attachments_dir}") from None
 
         # Define patterns to match different file types
         file_patterns = {
@@ -168,14 +299,14 @@ class MedicalFileValidator:
                 try:
                     print(f"📄 Loading {status['filename']}...")
                     if status['filename'].endswith('.json'):
-                        json_content = processor.read_json_file(status['path'])
+                        json_content = processor.read_json_file_cached(status['path'])
                         attachments_content[key] = {
                             'filename': status['filename'],
                             'type': 'json',
                             'content': json_content
                         }
                     elif status['filename'].endswith('.md'):
-                        text_content = processor.read_text_file(status['path'])
+                        text_content = processor.read_text_file_cached(status['path'])
                         attachments_content[key] = {
                             'filename': status['filename'],
                             'type': 'markdown',
@@ -199,10 +330,14 @@ class MedicalFileValidator:
         Args:
             file_status: File status dictionary from validate_attachments_directory
         """
-        for _, status in file_status.items():
+        lines = []
+        for status in file_status.values():
             status_icon = "✅" if status['exists'] else "❌"
             status_text = "Found" if status['exists'] else "Missing"
-            print(f"{status_icon} {status['filename']}: {status_text}")
+            lines.append(f"{status_icon} {status['filename']}: {status_text}")
+        
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
 
 
 class OutputManager:
@@ -210,22 +345,38 @@ class OutputManager:
     
     DEFAULT_OUTPUT_DIR = "./output"
     
+    REPORT_FILENAMES = ('raw_response.txt', 'correlation_report.json', 'correlation_report.txt')
+    
     def __init__(self, output_dir: str = DEFAULT_OUTPUT_DIR):
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
     
-    def save_raw_response(self, response: str) -> str:
+    def remove_stale_reports(self) -> None:
+        """
+        Remove reports left by a previous run
+        
+        Call only once a new response is in hand. Without this, a text fallback
+        report from an earlier run would sit next to a freshly written JSON
+        report (or vice versa).
+        """
+        for filename in self.REPORT_FILENAMES:
+            try:
+                os.remove(os.path.join(self.output_dir, filename))
+            except FileNotFoundError:
+                pass
+    
+    def save_raw_response(self, response: Union[str, bytes]) -> str:
         """
         Save raw API response to file
         
         Args:
-            response: Raw response text
+            response: Raw response text, or its UTF-8 encoding
             
         Returns:
             Path to saved file
         """
         file_path = os.path.join(self.output_dir, 'raw_response.txt')
-        FileProcessor.write_text_file(file_path, response)
+        FileProcessor.write_text_or_bytes(file_path, response)
         return file_path
     
     def save_json_report(self, data: Dict[str, Any]) -> str:
@@ -242,16 +393,16 @@ class OutputManager:
         FileProcessor.write_json_file(file_path, data)
         return file_path
     
-    def save_text_report(self, content: str) -> str:
+    def save_text_report(self, content: Union[str, bytes]) -> str:
         """
         Save text report to file
         
         Args:
-            content: Text content to save
+            content: Text content to save, or its UTF-8 encoding
             
         Returns:
             Path to saved file
         """
         file_path = os.path.join(self.output_dir, 'correlation_report.txt')
-        FileProcessor.write_text_file(file_path, content)
+        FileProcessor.write_text_or_bytes(file_path, content)
         return file_path
@@ -5,16 +5,100 @@ This module contains the specialized medical workflow functions for
 PDF-DICOM correlation analysis using the legacy SendToLLM system.
 """
 
+import hashlib
+import io
 import json
-from typing import Dict, Any, Optional, List, Union
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Final, Optional, List, Union, Tuple
 from .file_operations import MedicalFileValidator, FileProcessor
 from .abacus_client import get_client
 from .response_processor import ResponseProcessor
 
+try:
+    import orjson
+except ImportError:  # optional accelerator, stdlib json is used otherwise
+    orjson = None
+
+
+def _write_json(buf: io.StringIO, data: Any) -> None:
+    """
+    Serialize data as compact JSON straight into buf, using orjson when available
+    
+    Attachments are only read by the model, so indentation would just add tokens.
+    """
+    if orjson is not None:
+        try:
+            buf.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode('utf-8'))
+            return
+        except TypeError:  # integers beyond 64 bits or NaN/Infinity; stdlib writes them unchanged
+            pass
+    json.dump(data, buf, separators=(',', ':'), ensure_ascii=False)
+
+
+# Attachment readers for the legacy workflow, keyed by lowercase file extension
+_LOADERS: Final[Dict[str, Callable[[str], Any]]] = {
+    '.json': FileProcessor.read_json_file_cached,
+    '.md': FileProcessor.read_text_file_cached,
+}
+
+
+def _load_attachment(status: Dict[str, Any]) -> Tuple[Any, Optional[Exception]]:
+    """Read one attachment for the legacy workflow, returning (content, error)"""
+    loader = _LOADERS.get(os.path.splitext(status['filename'])[1].lower())
+    if loader is None:
+        return None, None
+    try:
+        return loader(status['path']), None
+    except Exception as e:
+        return None, e
+
+
+# Fence opener and body writer for each attachment type the workflow loads
+_BLOCK_WRITERS: Final[Dict[str, Tuple[str, Callable[[io.StringIO, Any], Any]]]] = {
+    'json': ("```json\n", _write_json),
+    'markdown': ("```markdown\n", io.StringIO.write),
+}
+
+
+# Critical instructions appended to every comprehensive message
+_CRITICAL_FOOTER: Final[str] = "\n".join([
+    "---",
+    "",
+    "CRITICAL: Split into TWO separate sections as specified in the prompt:",
+    "",
+    "SECTION 1 - KEYWORD SEARCH RESULTS (2 documents):",
+    "1. Wave Imag (SUB 2023-09-29)_M_DL_2024-07-02_OCR.pdf",
+    "2. K Trinh MD_Pain_Pac Spn Ortho (SUB 2024-01-08)_MB_DL_2024-07-02_OCR.pdf",
+    "",
+    "SECTION 2 - VECTOR SEARCH RESULTS (5 documents):",
+    "3. Beach Imag (SUB 2023-10-06)_M_DL_2024-07-02_OCR.pdf",
+    "4. Nguyen, N_Tsuruda.Chidi_2024-20-24.pdf",
+    "5. Orng Cst Mem Med Ctr (SUB 2023-10-05)_M_DL_2024-07-02_OCR.pdf",
+    "6. Healthpiont Med Grp (SUB 2023-10-18)_M_DL_2024-07-02_OCR.pdf",
+    "7. Heights Surg Inst (SUB 2023-11-10)_M_DL_2024-07-02_OCR.pdf",
+    "",
+    "Requirements:",
+    "- Create separate 'Keyword_Search_Results' and 'Vector_Search_Results' sections",
+    "- Follow the prompt structure exactly with two distinct sections",
+    "- Include ALL documents with paths, pages, and highlights",
+    "- Include source references with document names and page numbers",
+    "- Include Findings & Impression, Procedures and Billing, Timeline sections",
+    "",
+    "Output format:",
+    "JSON_REPORT_START",
+    "{json with separate keyword and vector search sections}",
+    "JSON_REPORT_END"
+])
+
 
 class MedicalMessageBuilder:
     """Builds comprehensive messages for medical correlation analysis"""
     
+    # Static message header, rendered once at class load
+    _HEADER_TMPL = "# Medical PDF-DICOM Correlation Analysis\n\n## Instructions:\n{prompt}\n\n## Attached Files:\n\n"
+    
     @staticmethod
     def build_comprehensive_message(prompt_text: str, 
                                   attachments_content: Dict[str, Any]) -> str:
@@ -28,64 +112,27 @@ class MedicalMessageBuilder:
         Returns:
             Complete message string
         """
-        message_parts = [
-            "# Medical PDF-DICOM Correlation Analysis",
-            "",
-            "## Instructions:",
-            prompt_text,
-            "",
-            "## Attached Files:",
-            ""
-        ]
+        buf = io.StringIO()
+        buf.write(MedicalMessageBuilder._HEADER_TMPL.format(prompt=prompt_text))
         
         # Add each file's content to the message
-        for key, content_info in attachments_content.items():
+        for content_info in attachments_content.values():
             if content_info:
-                message_parts.append(f"### {content_info['filename']}")
-                message_parts.append("")
+                buf.write(f"### {content_info['filename']}\n\n")
                 
-                if content_info['type'] == 'json':
-                    message_parts.append("```json")
-                    message_parts.append(json.dumps(content_info['content'], indent=2))
-                    message_parts.append("```")
-                elif content_info['type'] == 'markdown':
-                    message_parts.append("```markdown")
-                    message_parts.append(content_info['content'])
-                    message_parts.append("```")
+                block = _BLOCK_WRITERS.get(content_info['type'])
+                if block:
+                    fence, write_body = block
+                    buf.write(fence)
+                    write_body(buf, content_info['content'])
+                    buf.write("\n```\n")
                 
-                message_parts.append("")
+                buf.write("\n")
         
         # Add critical instructions and requirements
-        message_parts.extend([
-            "---",
-            "",
-            "CRITICAL: Split into TWO separate sections as specified in the prompt:",
-            "",
-            "SECTION 1 - KEYWORD SEARCH RESULTS (2 documents):",
-            "1. Wave Imag (SUB 2023-09-29)_M_DL_2024-07-02_OCR.pdf",
-            "2. K Trinh MD_Pain_Pac Spn Ortho (SUB 2024-01-08)_MB_DL_2024-07-02_OCR.pdf",
-            "",
-            "SECTION 2 - VECTOR SEARCH RESULTS (5 documents):",
-            "3. Beach Imag (SUB 2023-10-06)_M_DL_2024-07-02_OCR.pdf",
-            "4. Nguyen, N_Tsuruda.Chidi_2024-20-24.pdf",
-            "5. Orng Cst Mem Med Ctr (SUB 2023-10-05)_M_DL_2024-07-02_OCR.pdf",
-            "6. Healthpiont Med Grp (SUB 2023-10-18)_M_DL_2024-07-02_OCR.pdf",
-            "7. Heights Surg Inst (SUB 2023-11-10)_M_DL_2024-07-02_OCR.pdf",
-            "",
-            "Requirements:",
-            "- Create separate 'Keyword_Search_Results' and 'Vector_Search_Results' sections",
-            "- Follow the prompt structure exactly with two distinct sections",
-            "- Include ALL documents with paths, pages, and highlights",
-            "- Include source references with document names and page numbers",
-            "- Include Findings & Impression, Procedures and Billing, Timeline sections",
-            "",
-            "Output format:",
-            "JSON_REPORT_START",
-            "{json with separate keyword and vector search sections}",
-            "JSON_REPORT_END"
-        ])
+        buf.write(_CRITICAL_FOOTER)
         
-        return "\n".join(message_parts)
+        return buf.getvalue()
     
     @staticmethod
     def build_legacy_message(prompt_text: str, 
@@ -100,26 +147,26 @@ class MedicalMessageBuilder:
         Returns:
             Complete message string
         """
-        message_parts = [
-            prompt_text,
-            "",
-            "ATTACHED DATA:",
-            "",
-            "1. KEYWORD SEARCH RESULTS:",
-            json.dumps(attachments_data.get('keyword_search'), indent=2) 
-            if attachments_data.get('keyword_search') else 'No keyword search data available',
-            "",
-            "2. VECTOR SEARCH RESULTS:",
-            json.dumps(attachments_data.get('vector_search'), indent=2) 
-            if attachments_data.get('vector_search') else 'No vector search data available',
-            "",
-            "3. CORRELATION REPORT TEMPLATE:",
-            attachments_data.get('correlation_report', 'No correlation report template available'),
-            "",
-            "Please generate the correlation reports as specified in the prompt instructions."
-        ]
+        buf = io.StringIO()
+        buf.write(f"{prompt_text}\n\nATTACHED DATA:\n\n")
+        
+        buf.write("1. KEYWORD SEARCH RESULTS:\n")
+        if attachments_data.get('keyword_search'):
+            _write_json(buf, attachments_data['keyword_search'])
+        else:
+            buf.write('No keyword search data available')
+        
+        buf.write("\n\n2. VECTOR SEARCH RESULTS:\n")
+        if attachments_data.get('vector_search'):
+            _write_json(buf, attachments_data['vector_search'])
+        else:
+            buf.write('No vector search data available')
+        
+        buf.write("\n\n3. CORRELATION REPORT TEMPLATE:\n")
+        buf.write(attachments_data.get('correlation_report') or 'No correlation report template available')
+        buf.write("\n\nPlease generate the correlation reports as specified in the prompt instructions.")
         
-        return "\n".join(message_parts)
+        return buf.getvalue()
 
 
 class MedicalWorkflow:
@@ -128,10 +175,42 @@ class MedicalWorkflow:
     DEFAULT_ATTACHMENTS_DIR = "./data/to_llm/attachments"
     DEFAULT_PROMPT_FILE = "./data/to_llm/prompt/prompt_v8.txt"
     
-    def __init__(self):
+    def __init__(self, response_cache_dir: Optional[str] = None):
         self.client = get_client()
         self.processor = ResponseProcessor()
         self.message_builder = MedicalMessageBuilder()
+        # Exact-match response cache, disabled unless a directory is configured
+        self.response_cache_dir = response_cache_dir or os.getenv('ABACUS_RESPONSE_CACHE_DIR')
+    
+    def _send_chat_request_cached(self, messages: List[Dict[str, Any]], **request_kwargs: Any) -> Dict[str, Any]:
+        """
+        Send a chat request, reusing the saved response for an identical earlier request
+        
+        Args:
+            messages: Chat messages to send
+            **request_kwargs: Remaining send_chat_request arguments
+            
+        Returns:
+            API response dictionary
+        """
+        if not self.response_cache_dir:
+            return self.client.send_chat_request(messages=messages, **request_kwargs)
+        
+        key_source = json.dumps({'messages': messages, **request_kwargs}, sort_keys=True)
+        key = hashlib.blake2b(key_source.encode('utf-8'), digest_size=16).hexdigest()
+        cache_path = os.path.join(self.response_cache_dir, f"{key}.json")
+        
+        if os.path.exists(cache_path):
+            print(f"♻️  Using cached response: {cache_path}")
+            return FileProcessor.read_json_file(cache_path)
+        
+        response = self.client.send_chat_request(messages=messages, **request_kwargs)
+        
+        # Write to a temporary file first so readers never see a partial entry
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        FileProcessor.write_json_file(tmp_path, response)
+        os.replace(tmp_path, cache_path)
+        return response
     
     def send_medical_correlation_data_with_attachments(self,
                                                      attachments_dir: str = DEFAULT_ATTACHMENTS_DIR,
@@ -160,7 +239,7 @@ class MedicalWorkflow:
         
         # Read the prompt from file
         try:
-            prompt_text = FileProcessor.read_text_file(prompt_file)
+            prompt_text = FileProcessor.read_text_file_cached(prompt_file)
             print(f"✅ Prompt file loaded: {prompt_file}")
         except FileNotFoundError:
             raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
@@ -184,8 +263,8 @@ class MedicalWorkflow:
         }]
         
         # Send to API
-        return self.client.send_chat_request(
-            messages=messages,
+        return self._send_chat_request_cached(
+            messages,
             deployment_token=deployment_token,
             deployment_id=deployment_id,
             api_key=api_key,
@@ -220,46 +299,47 @@ class MedicalWorkflow:
         
         # Read the prompt from file
         try:
-            base_prompt = FileProcessor.read_text_file(prompt_file)
+            base_prompt = FileProcessor.read_text_file_cached(prompt_file)
             print(f"✅ Prompt file loaded: {prompt_file}")
         except FileNotFoundError:
             raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
         
-        # Read all attachment files
+        # Read all attachment files concurrently, reporting in directory order
+        existing = {key: status for key, status in file_status.items() if status['exists']}
+        futures = {}
+        if existing:
+            with ThreadPoolExecutor(max_workers=min(8, len(existing))) as executor:
+                futures = {key: executor.submit(_load_attachment, status) for key, status in existing.items()}
+        
         attachments_data: Dict[str, Union[Dict[str, Any], str, None]] = {}
+        load_log = []
         for key, status in file_status.items():
-            if status['exists']:
-                try:
-                    if status['filename'].endswith('.json'):
-                        attachments_data[key] = FileProcessor.read_json_file(status['path'])
-                    elif status['filename'].endswith('.md'):
-                        attachments_data[key] = FileProcessor.read_text_file(status['path'])
-                    print(f"✅ Loaded {status['filename']}")
-                except Exception as e:
-                    print(f"❌ Error loading {status['filename']}: {e}")
-                    attachments_data[key] = None
+            if key in futures:
+                content, error = futures[key].result()
+                if error is None:
+                    load_log.append(f"✅ Loaded {status['filename']}")
+                else:
+                    load_log.append(f"❌ Error loading {status['filename']}: {error}")
+                attachments_data[key] = content
             else:
-                print(f"⚠️  Skipping missing file: {status['filename']}")
+                load_log.append(f"⚠️  Skipping missing file: {status['filename']}")
                 attachments_data[key] = None
         
+        if load_log:
+            sys.stdout.write("\n".join(load_log) + "\n")
+        
         # Build legacy message
         final_prompt = self.message_builder.build_legacy_message(base_prompt, attachments_data)
         
-        # Combine all data for the API call
-        combined_data = {
-            "prompt_instructions": base_prompt,
-            "attachments": attachments_data
-        }
-        
-        # Prepare chat message
+        # Prepare chat message (the legacy message already embeds every attachment)
         messages = [{
             "is_user": True,
-            "text": f"{final_prompt}\n\nJSON Data:\n{json.dumps(combined_data, indent=2)}"
+            "text": final_prompt
         }]
         
         # Send to API
-        return self.client.send_chat_request(
-            messages=messages,
+        return self._send_chat_request_cached(
+            messages,
             deployment_token=deployment_token,
             deployment_id=deployment_id,
             api_key=api_key,
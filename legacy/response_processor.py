@@ -6,8 +6,11 @@ and output file generation for medical correlation analysis.
 """
 
 import json
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, Tuple
-from .file_operations import OutputManager
+from .file_operations import OutputManager, _json_loads
 
 
 class ResponseProcessor:
@@ -16,6 +19,15 @@ class ResponseProcessor:
     JSON_START_MARKER = "JSON_REPORT_START"
     JSON_END_MARKER = "JSON_REPORT_END"
     
+    # Matches the marker block in a single pass over the response
+    _MARKER_RE = re.compile(
+        re.escape(JSON_START_MARKER) + r"(.*?)" + re.escape(JSON_END_MARKER), re.DOTALL
+    )
+    
+    # First non-whitespace character of a JSON object or array candidate
+    _OPENER_RE = re.compile(r"\s*([\[{])")
+    _CLOSERS = {'{': '}', '[': ']'}
+    
     def __init__(self, output_manager: Optional[OutputManager] = None):
         self.output_manager = output_manager or OutputManager()
     
@@ -46,12 +58,9 @@ class ResponseProcessor:
         Returns:
             JSON content string or None if markers not found
         """
-        start_pos = response_text.find(self.JSON_START_MARKER)
-        end_pos = response_text.find(self.JSON_END_MARKER)
-        
-        if start_pos != -1 and end_pos != -1:
-            start_pos += len(self.JSON_START_MARKER)
-            return response_text[start_pos:end_pos].strip()
+        match = self._MARKER_RE.search(response_text)
+        if match:
+            return match.group(1).strip()
         
         return None
     
@@ -83,10 +92,20 @@ class ResponseProcessor:
         Returns:
             Tuple of (is_valid, parsed_data, error_message)
         """
+        # Cheap structural check: skip the parse (and its exception) when the
+        # candidate cannot be an object or array, e.g. a trailing code fence.
+        # Only the surrounding whitespace is scanned; the content is not copied.
+        opener = self._OPENER_RE.match(json_content)
+        end = len(json_content)
+        while end and json_content[end - 1].isspace():
+            end -= 1
+        if opener is None or json_content[end - 1] != self._CLOSERS[opener.group(1)]:
+            return False, None, "Content is not a JSON object or array"
+        
         try:
-            parsed_data = json.loads(json_content)
+            parsed_data = _json_loads(json_content)
             return True, parsed_data, None
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError is a subclass
             return False, None, str(e)
     
     def extract_json_report(self, response_text: str) -> Tuple[bool, Optional[Dict[str, Any]], str]:
@@ -148,18 +167,25 @@ class ResponseProcessor:
         
         print("AI Response received, processing and saving files...")
         
-        # Save raw response
+        # A response is in hand, so the previous run's reports can be replaced
+        self.output_manager.remove_stale_reports()
+        
+        # Encode once; both the raw and text-report saves write these bytes
+        ai_bytes = ai_response.encode('utf-8')
+        
+        # Save raw response in the background while the JSON report is extracted
+        with ThreadPoolExecutor(max_workers=1) as io_executor:
+            raw_future = io_executor.submit(self.output_manager.save_raw_response, ai_bytes)
+            json_success, json_data, method = self.extract_json_report(ai_response)
+        
         try:
-            raw_path = self.output_manager.save_raw_response(ai_response)
+            raw_path = raw_future.result()
             results['raw_saved'] = True
             results['files_created'].append(raw_path)
             print(f"Raw response saved to {raw_path}")
         except Exception as e:
             results['errors'].append(f"Failed to save raw response: {e}")
         
-        # Extract and save JSON report
-        json_success, json_data, method = self.extract_json_report(ai_response)
-        
         if json_success and json_data:
             try:
                 json_path = self.output_manager.save_json_report(json_data)
@@ -171,7 +197,7 @@ class ResponseProcessor:
         else:
             # Save as text file if JSON extraction fails
             try:
-                text_path = self.output_manager.save_text_report(ai_response)
+                text_path = self.output_manager.save_text_report(ai_bytes)
                 results['text_saved'] = True
                 results['files_created'].append(text_path)
                 print(f"⚠️  Could not extract valid JSON, saved as text: {text_path}")
@@ -193,23 +219,22 @@ class ResponseProcessor:
         Args:
             results: Results dictionary from process_medical_response
         """
-        print("\n" + "="*50)
-        print("Response Processing Summary:")
-        print("="*50)
+        lines = ["", "=" * 50, "Response Processing Summary:", "=" * 50]
         
         if results['success']:
-            print("✅ Processing completed successfully")
+            lines.append("✅ Processing completed successfully")
         else:
-            print("❌ Processing failed")
+            lines.append("❌ Processing failed")
         
         if results['files_created']:
-            print(f"📁 Files created: {len(results['files_created'])}")
-            for file_path in results['files_created']:
-                print(f"   - {file_path}")
+            lines.append(f"📁 Files created: {len(results['files_created'])}")
+            lines.extend(f"   - {file_path}" for file_path in results['files_created'])
         
         if results['errors']:
-            print(f"⚠️  Errors encountered: {len(results['errors'])}")
-            for error in results['errors']:
-                print(f"   - {error}")
+            lines.append(f"⚠️  Errors encountered: {len(results['errors'])}")
+            lines.extend(f"   - {error}" for error in results['errors'])
+        
+        lines.append("=" * 50)
         
-        print("="*50)
+        # Emit the whole summary in one write
+        sys.stdout.write("\n".join(lines) + "\n")
@@ -4,6 +4,77 @@ Extract JSON from raw_response.txt and save to report.json
 """
 import json
 import os
+import re
+
+try:
+    import orjson
+except ImportError:  # optional accelerator, stdlib json is used otherwise
+    orjson = None
+
+class _NonFiniteFloat(float):
+    """NaN/Infinity from stdlib json; orjson refuses to encode it, so _dump_json_bytes falls back to stdlib"""
+
+# orjson silently turns integers wider than 64 bits into floats, so any
+# report with a digit run this long is parsed by stdlib json instead
+_WIDE_INT_RE = re.compile(r'[0-9]{19}')
+
+def _json_loads(content):
+    """Parse JSON with orjson only when it yields exactly what stdlib json would"""
+    if orjson is not None and _WIDE_INT_RE.search(content) is None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity, which stdlib json accepts
+    return json.loads(content, parse_constant=_NonFiniteFloat)
+
+def _dump_json_bytes(data):
+    """Pretty-print data as UTF-8 JSON bytes (2-space indent), using orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:  # integers beyond 64 bits or NaN/Infinity; stdlib writes them unchanged
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+# ```json fenced block (closing fence optional), else first { to last }
+_FENCE_RE = re.compile(r"```json(.*?)(?:```|\Z)", re.DOTALL)
+_OBJ_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# String literals (skipped whole) or structural brackets
+_BRACKET_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*"|[\[\]{}]')
+_CLOSERS = {'{': '}', '[': ']'}
+
+def _repair_brackets(content):
+    """Rewrite mismatched closing brackets and append missing ones, ignoring string contents"""
+    pieces = []
+    stack = []
+    last = 0
+    for match in _BRACKET_TOKEN_RE.finditer(content):
+        token = match.group(0)
+        if token in _CLOSERS:
+            stack.append(_CLOSERS[token])
+        elif token in '}]' and stack:
+            expected = stack.pop()
+            if token != expected:
+                pieces.append(content[last:match.start()])
+                pieces.append(expected)
+                last = match.end()
+    pieces.append(content[last:])
+    pieces.extend(reversed(stack))
+    return ''.join(pieces)
+
+def _tolerant_json_load(content):
+    """Parse JSON, retrying once with bracket mismatches repaired (e.g. an array closed by '}')"""
+    try:
+        return _json_loads(content)
+    except json.JSONDecodeError as e:
+        repaired = _repair_brackets(content)
+        if repaired == content:
+            raise
+        try:
+            return _json_loads(repaired)
+        except json.JSONDecodeError:
+            raise e
 
 def extract_and_save_json():
     """Extract JSON from raw response and save to report.json"""
@@ -19,48 +90,26 @@ def extract_and_save_json():
     # Clean the content - remove markdown formatting and extract JSON
     cleaned_content = raw_content.strip()
 
-    # Find JSON content between ```json and ``` markers
-    json_start_marker = '```json'
-    json_end_marker = '```'
-
-    json_start = cleaned_content.find(json_start_marker)
-    if json_start != -1:
-        # Start after the ```json marker
-        json_start += len(json_start_marker)
-        # Find the closing ``` marker
-        json_end = cleaned_content.find(json_end_marker, json_start)
-        if json_end != -1:
-            cleaned_content = cleaned_content[json_start:json_end].strip()
-        else:
-            # If no closing marker, take everything after ```json
-            cleaned_content = cleaned_content[json_start:].strip()
+    # Find JSON content between ```json and ``` markers, falling back to
+    # the outermost braces when there is no fenced block
+    match = _FENCE_RE.search(cleaned_content)
+    if match:
+        cleaned_content = match.group(1).strip()
     else:
-        # If no ```json marker, try to find JSON by looking for opening brace
-        brace_start = cleaned_content.find('{')
-        if brace_start != -1:
-            # Find the last closing brace
-            brace_end = cleaned_content.rfind('}')
-            if brace_end != -1 and brace_end > brace_start:
-                cleaned_content = cleaned_content[brace_start:brace_end + 1].strip()
+        match = _OBJ_RE.search(cleaned_content)
+        if match:
+            cleaned_content = match.group(0).strip()
 
-    # Fix common JSON syntax errors (if any)
-    # This is a specific fix for a known issue - can be removed if not needed
-    if '"timeline_of_events"' in cleaned_content:
-        cleaned_content = cleaned_content.replace(
-            '"2024-05-15: Surgery scheduled after patient consent. *(Source: Document 4, Page 579)*"\n    }',
-            '"2024-05-15: Surgery scheduled after patient consent. *(Source: Document 4, Page 579)*"\n    ]'
-        )
-    
     try:
-        # Parse the JSON to validate it
-        json_data = json.loads(cleaned_content)
+        # Parse the JSON to validate it, repairing mismatched brackets if needed
+        json_data = _tolerant_json_load(cleaned_content)
         
         # Create output directory if it doesn't exist
         os.makedirs('./output', exist_ok=True)
         
-        # Save to report.json
-        with open('./output/report.json', 'w', encoding='utf-8') as output_file:
-            json.dump(json_data, output_file, indent=4, ensure_ascii=False)
+        # Save to report.json in a single write of the encoded bytes
+        with open('./output/report.json', 'wb') as output_file:
+            output_file.write(_dump_json_bytes(json_data))
         
         print("✅ Successfully extracted and saved JSON to ./output/report.json")
 
@@ -95,7 +144,7 @@ def extract_and_save_json():
         
         return True
         
-    except json.JSONDecodeError as e:
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError is a subclass
         print(f"❌ JSON parsing error: {e}")
         print("Raw content preview:")
         print(cleaned_content[:500] + "..." if len(cleaned_content) > 500 else cleaned_content)
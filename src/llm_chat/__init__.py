@@ -18,6 +18,8 @@ Example Usage:
     print(response.content)
 """
 
+from typing import Final
+
 from .config import get_config, ModelConfig, LLMConfig
 from .chat_llm import create_chat_client, LLMChatClient, ChatMessage, ChatResponse
 
@@ -39,5 +41,5 @@ __all__ = [
 ]
 
 # Package metadata
-SUPPORTED_PROVIDERS = ['abacus', 'openai', 'anthropic']
+SUPPORTED_PROVIDERS: Final[frozenset[str]] = frozenset({'abacus', 'openai', 'anthropic'})
 DEFAULT_MODEL = 'abacus-gpt5'
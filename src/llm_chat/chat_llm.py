@@ -3,21 +3,57 @@ Enhanced chat system for LLM interactions with multiple provider support
 Supports Abacus.AI, OpenAI, and other providers with file attachments
 """
 
+import io
 import json
+import mmap
 import os
+import re
 import requests
-from typing import List, Dict, Any, Optional, Union
-from dataclasses import dataclass
-from .config import get_config, ModelConfig
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Any, Callable, Deque, Optional, Tuple, Union
+from dataclasses import dataclass, field
+from functools import cached_property
+from .config import get_config, LLMConfig, ModelConfig
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # optional accelerator, stdlib json is used otherwise
+    orjson = None  # type: ignore[assignment]
+
+class _NonFiniteFloat(float):
+    """NaN/Infinity from stdlib json; orjson refuses to encode it, so _pretty_json falls back to stdlib"""
+
+# orjson silently turns integers wider than 64 bits into floats, so any
+# attachment with a digit run this long is parsed by stdlib json instead
+_WIDE_INT_RE = re.compile(rb'[0-9]{19}')
+
+def _json_loads(raw: Union[bytes, memoryview]) -> Any:
+    """Parse JSON bytes with orjson only when it yields exactly what stdlib json would"""
+    if orjson is not None and _WIDE_INT_RE.search(raw) is None:
+        try:
+            # orjson reads the buffer as-is
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity, which stdlib json accepts
+    return json.loads(str(raw, 'utf-8'), parse_constant=_NonFiniteFloat)
+
+def _as_text(value: Any) -> str:
+    """Return value unchanged if it is already a str, otherwise its str() form"""
+    return value if type(value) is str else str(value)
+
+@dataclass(slots=True)
 class ChatMessage:
     """Represents a chat message"""
     role: str  # 'user', 'assistant', 'system'
     content: str
     attachments: Optional[List[Dict[str, Any]]] = None
+    # Abacus-formatted message, built on first send and reused for later turns
+    _abacus_cached: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ChatResponse:
     """Represents a response from the LLM"""
     content: str
@@ -29,10 +65,55 @@ class ChatResponse:
 class LLMChatClient:
     """Universal chat client for multiple LLM providers"""
     
-    def __init__(self, model_name: Optional[str] = None):
-        self.config = get_config()
-        self.model_config = self.config.get_model_config(model_name)
-        self.conversation_history: List[ChatMessage] = []
+    # Attachments larger than this are memory-mapped instead of copied into a bytes object
+    MMAP_THRESHOLD = 4 * 1024 * 1024
+    
+    def __init__(self, model_name: Optional[str] = None, history_limit: Optional[int] = None):
+        if history_limit is not None and history_limit < 1:
+            raise ValueError(f"history_limit must be None or at least 1, got {history_limit}")
+        
+        # Configuration is resolved on first use, so idle clients never touch the environment
+        self._model_name = model_name
+        # Bounded history drops the oldest messages in O(1) once history_limit is reached
+        self.conversation_history: Deque[ChatMessage] = deque(maxlen=history_limit)
+        self._session = self._create_session()
+    
+    @cached_property
+    def config(self) -> LLMConfig:
+        """Global LLM configuration"""
+        return get_config()
+    
+    @cached_property
+    def model_config(self) -> ModelConfig:
+        """Configuration of the model this client talks to"""
+        return self.config.get_model_config(self._model_name)
+    
+    @cached_property
+    def _send(self) -> Callable[[bool], ChatResponse]:
+        """Provider backend, resolved once on first send"""
+        send = {
+            'abacus': self._send_to_abacus,
+            'openai': self._send_to_openai,
+            'anthropic': self._send_to_anthropic,
+        }.get(self.model_config.provider)
+        if send is None:
+            raise ValueError(f"Unsupported provider: {self.model_config.provider}")
+        return send
+    
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create a pooled HTTP session that retries rate-limited and transient server errors"""
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({'POST'})
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
     
     def add_message(self, role: str, content: str, attachments: Optional[List[Dict[str, Any]]] = None):
         """Add a message to the conversation history"""
@@ -41,7 +122,7 @@ class LLMChatClient:
     
     def clear_history(self):
         """Clear the conversation history"""
-        self.conversation_history = []
+        self.conversation_history.clear()
     
     def send_message(self, 
                     message: str, 
@@ -54,8 +135,9 @@ class LLMChatClient:
         Args:
             message: The user message to send
             attachments: List of file paths to attach
-            system_prompt: Optional system prompt
-            include_history: Whether to include conversation history
+            system_prompt: Optional system prompt (not currently sent to Abacus.AI)
+            include_history: Whether to include conversation history. When False the
+                exchange is stateless and is not recorded in conversation_history
         
         Returns:
             ChatResponse object with the LLM's response
@@ -66,22 +148,15 @@ class LLMChatClient:
         if attachments:
             processed_attachments = self._process_attachments(attachments)
         
-        # Add system prompt if provided
-        if system_prompt and not include_history:
-            self.add_message('system', system_prompt)
+        # Stateless fast path: nothing is kept, so large attachments are freed after the call
+        if not include_history and self._send == self._send_to_abacus:
+            return self._send_oneshot(message, processed_attachments)
         
         # Add user message
         self.add_message('user', message, processed_attachments)
         
         # Send to appropriate provider
-        if self.model_config.provider == 'abacus':
-            response = self._send_to_abacus(include_history)
-        elif self.model_config.provider == 'openai':
-            response = self._send_to_openai(include_history)
-        elif self.model_config.provider == 'anthropic':
-            response = self._send_to_anthropic(include_history)
-        else:
-            raise ValueError(f"Unsupported provider: {self.model_config.provider}")
+        response = self._send(include_history)
         
         # Add assistant response to history
         self.add_message('assistant', response.content)
@@ -89,81 +164,91 @@ class LLMChatClient:
         return response
     
     def _process_attachments(self, attachment_paths: List[str]) -> List[Dict[str, Any]]:
-        """Process file attachments"""
-        processed = []
+        """Process file attachments, reading and parsing files concurrently"""
+        if len(attachment_paths) <= 1:
+            results = [self._process_one_attachment(path) for path in attachment_paths]
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(attachment_paths))) as executor:
+                results = list(executor.map(self._process_one_attachment, attachment_paths))
+        
+        return [attachment for attachment in results if attachment is not None]
+    
+    def _process_one_attachment(self, path: str) -> Optional[Dict[str, Any]]:
+        """Read and classify a single attachment, returning None if it cannot be loaded"""
+        filename = os.path.basename(path)
+        file_ext = os.path.splitext(filename)[1].lower()
         
-        for path in attachment_paths:
-            if not os.path.exists(path):
-                print(f"Warning: Attachment file not found: {path}")
-                continue
+        try:
+            # Single unbuffered open; a missing file surfaces here instead of a separate exists() check
+            with open(path, 'rb', buffering=0) as f:
+                if os.fstat(f.fileno()).st_size > self.MMAP_THRESHOLD:
+                    # Decode straight from the page cache without an intermediate copy
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as raw:
+                        content, file_type = self._decode_attachment(raw, file_ext)
+                else:
+                    content, file_type = self._decode_attachment(f.readall(), file_ext)
             
+            return {
+                'filename': filename,
+                'path': path,
+                'type': file_type,
+                'content': content
+            }
+            
+        except FileNotFoundError:
+            print(f"Warning: Attachment file not found: {path}")
+        except Exception as e:
+            print(f"Error processing attachment {path}: {e}")
+        return None
+    
+    @staticmethod
+    def _pretty_json(content: Any) -> str:
+        """Serialize parsed JSON with 2-space indentation, using orjson when available"""
+        if orjson is not None:
             try:
-                # Read file content
-                with open(path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Determine file type
-                file_ext = os.path.splitext(path)[1].lower()
-                if file_ext == '.json':
-                    try:
-                        content = json.loads(content)
-                        file_type = 'json'
-                    except json.JSONDecodeError:
-                        file_type = 'text'
-                elif file_ext in ['.md', '.txt']:
-                    file_type = 'text'
-                else:
-                    file_type = 'text'
-                
-                processed.append({
-                    'filename': os.path.basename(path),
-                    'path': path,
-                    'type': file_type,
-                    'content': content
-                })
-                
-            except Exception as e:
-                print(f"Error processing attachment {path}: {e}")
-        
-        return processed
+                return orjson.dumps(content, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+            except TypeError:  # integers beyond 64 bits or NaN/Infinity; stdlib writes them unchanged
+                pass
+        return json.dumps(content, indent=2, ensure_ascii=False)
+    
+    @staticmethod
+    def _decode_attachment(raw: Union[bytes, memoryview], file_ext: str) -> Tuple[Any, str]:
+        """Decode raw attachment bytes into (content, file_type), parsing JSON files directly from the buffer"""
+        # Sniff the first non-whitespace byte so non-JSON content skips the parse attempt
+        if file_ext == '.json' and bytes(raw[:64]).lstrip()[:1] in (b'{', b'[', b''):
+            try:
+                return _json_loads(raw), 'json'
+            except json.JSONDecodeError:  # orjson.JSONDecodeError is a subclass
+                pass
+        text = str(raw, 'utf-8')
+        if '\r' in text:
+            # Normalize line endings the way text-mode open() does
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text, 'text'
+    
+    def _send_oneshot(self, message: str, attachments: List[Dict[str, Any]]) -> ChatResponse:
+        """Send a single message to Abacus.AI without reading or recording conversation history"""
+        chat_message = ChatMessage(role='user', content=message, attachments=attachments)
+        return self._post_to_abacus([self._to_abacus_message(chat_message)])
     
     def _send_to_abacus(self, include_history: bool) -> ChatResponse:
         """Send message to Abacus.AI"""
+        # Prepare messages (just the last one when history is excluded)
+        if include_history:
+            messages = [self._to_abacus_message(msg) for msg in self.conversation_history]
+        else:
+            messages = [self._to_abacus_message(self.conversation_history[-1])]
+        
+        return self._post_to_abacus(messages)
+    
+    def _post_to_abacus(self, messages: List[Dict[str, Any]]) -> ChatResponse:
+        """POST Abacus-formatted messages to getChatResponse and wrap the reply"""
         url = f"{self.model_config.base_url}/getChatResponse"
         
         headers = {"Content-Type": "application/json"}
         if self.model_config.api_key:
             headers["apiKey"] = self.model_config.api_key
         
-        # Prepare messages
-        messages = []
-        if include_history:
-            for msg in self.conversation_history:
-                abacus_msg = {
-                    "is_user": msg.role == 'user',
-                    "text": msg.content
-                }
-                
-                # Add attachments for Abacus format
-                if msg.attachments:
-                    attachment_text = self._format_attachments_for_abacus(msg.attachments)
-                    abacus_msg["text"] = str(abacus_msg["text"]) + f"\n\n{attachment_text}"
-                
-                messages.append(abacus_msg)
-        else:
-            # Just the last message
-            last_msg = self.conversation_history[-1]
-            abacus_msg = {
-                "is_user": True,
-                "text": last_msg.content
-            }
-            
-            if last_msg.attachments:
-                attachment_text = self._format_attachments_for_abacus(last_msg.attachments)
-                abacus_msg["text"] = str(abacus_msg["text"]) + f"\n\n{attachment_text}"
-            
-            messages = [abacus_msg]
-        
         payload = {
             "deploymentId": self.model_config.deployment_id,
             "messages": messages,
@@ -175,7 +260,11 @@ class LLMChatClient:
             payload["deploymentToken"] = self.model_config.deployment_token
         
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            if orjson is not None:
+                # Encode the body once as bytes; requests would otherwise run stdlib json.dumps
+                response = self._session.post(url, headers=headers, data=orjson.dumps(payload))
+            else:
+                response = self._session.post(url, headers=headers, json=payload)
             response.raise_for_status()
             result = response.json()
             
@@ -190,7 +279,7 @@ class LLMChatClient:
                 content = "Unexpected response format"
             
             return ChatResponse(
-                content=str(content),
+                content=_as_text(content),
                 model=self.model_config.model_name,
                 provider=self.model_config.provider,
                 raw_response=result
@@ -199,26 +288,40 @@ class LLMChatClient:
         except requests.exceptions.RequestException as e:
             raise Exception(f"Abacus.AI API request failed: {e}")
     
+    def _to_abacus_message(self, msg: ChatMessage) -> Dict[str, Any]:
+        """Convert a history message to Abacus format, formatting its attachments only once"""
+        if msg._abacus_cached is None:
+            text = msg.content
+            if msg.attachments:
+                attachment_text = self._format_attachments_for_abacus(msg.attachments)
+                text = f"{_as_text(text)}\n\n{attachment_text}"
+            msg._abacus_cached = {
+                "is_user": msg.role == 'user',
+                "text": text
+            }
+        return msg._abacus_cached
+    
     def _format_attachments_for_abacus(self, attachments: List[Dict[str, Any]]) -> str:
         """Format attachments for Abacus.AI message"""
         if not attachments:
             return ""
         
-        parts = ["## Attached Files:"]
+        # Serialize straight into one buffer rather than building per-file strings
+        buf = io.StringIO()
+        buf.write("## Attached Files:")
         
         for attachment in attachments:
-            parts.append(f"\n### {attachment['filename']}")
+            buf.write(f"\n\n### {attachment['filename']}\n")
             
             if attachment['type'] == 'json':
-                parts.append("```json")
-                parts.append(json.dumps(attachment['content'], indent=2))
-                parts.append("```")
+                buf.write("```json\n")
+                buf.write(self._pretty_json(attachment['content']))
             else:
-                parts.append("```")
-                parts.append(str(attachment['content']))
-                parts.append("```")
+                buf.write("```\n")
+                buf.write(_as_text(attachment['content']))
+            buf.write("\n```")
         
-        return "\n".join(parts)
+        return buf.getvalue()
     
     def _send_to_openai(self, include_history: bool) -> ChatResponse:
         """Send message to OpenAI (placeholder for future implementation)"""
@@ -228,6 +331,6 @@ class LLMChatClient:
         """Send message to Anthropic (placeholder for future implementation)"""
         raise NotImplementedError("Anthropic integration not yet implemented")
 
-def create_chat_client(model_name: Optional[str] = None) -> LLMChatClient:
+def create_chat_client(model_name: Optional[str] = None, history_limit: Optional[int] = None) -> LLMChatClient:
     """Create a new chat client instance"""
-    return LLMChatClient(model_name)
+    return LLMChatClient(model_name, history_limit)
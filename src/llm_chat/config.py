@@ -4,12 +4,24 @@ Supports multiple providers: Abacus.AI, OpenAI, etc.
 """
 
 import os
+import threading
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Callable, Mapping
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+_env_loaded = False
+
+def _ensure_env_loaded():
+    """Load .env into the environment once per process, unless LLM_CHAT_SKIP_DOTENV is set"""
+    global _env_loaded
+    if _env_loaded:
+        return
+    if not os.environ.get('LLM_CHAT_SKIP_DOTENV'):
+        # Variables already present in the environment take precedence over .env
+        load_dotenv(override=False)
+    # Set only after loading so a concurrent caller never sees a half-populated environment
+    _env_loaded = True
 
 @dataclass
 class ModelConfig:
@@ -27,16 +39,36 @@ class ModelConfig:
 class LLMConfig:
     """Main configuration class for LLM interactions"""
     
-    def __init__(self):
-        self.models = self._load_model_configs()
+    __slots__ = ('_factories', '_resolved', '_default_config', 'default_model')
+    
+    def __init__(self) -> None:
+        _ensure_env_loaded()
+        self._factories = self._load_model_configs()
+        self._resolved: Dict[str, ModelConfig] = {}
+        # Default model's config, kept aside so the common no-name lookup skips the dicts
+        self._default_config: Optional[ModelConfig] = None
         self.default_model = os.getenv('DEFAULT_MODEL', 'abacus-gpt5')
     
-    def _load_model_configs(self) -> Dict[str, ModelConfig]:
-        """Load model configurations from environment variables and defaults"""
-        configs = {}
+    @property
+    def models(self) -> Mapping[str, ModelConfig]:
+        """
+        All model configurations, resolving any not yet read from the environment
+        
+        The mapping is read-only; register models with add_custom_model().
+        """
+        return MappingProxyType({name: self.get_model_config(name) for name in self._factories})
+    
+    def _load_model_configs(self) -> Dict[str, Callable[[], ModelConfig]]:
+        """
+        Register model configurations from environment variables and defaults
+        
+        Each entry is a factory so a provider's environment is only read
+        when that model is first requested.
+        """
+        configs: Dict[str, Callable[[], ModelConfig]] = {}
         
         # Abacus.AI GPT-5 configuration
-        configs['abacus-gpt5'] = ModelConfig(
+        configs['abacus-gpt5'] = lambda: ModelConfig(
             provider='abacus',
             model_name='gpt-5',
             api_key=os.getenv('ABACUS_API_KEY'),
@@ -48,7 +80,7 @@ class LLMConfig:
         )
         
         # OpenAI GPT-4 configuration
-        configs['openai-gpt4'] = ModelConfig(
+        configs['openai-gpt4'] = lambda: ModelConfig(
             provider='openai',
             model_name='gpt-4',
             api_key=os.getenv('OPENAI_API_KEY'),
@@ -58,7 +90,7 @@ class LLMConfig:
         )
         
         # OpenAI GPT-5 configuration (when available)
-        configs['openai-gpt5'] = ModelConfig(
+        configs['openai-gpt5'] = lambda: ModelConfig(
             provider='openai',
             model_name='gpt-5',
             api_key=os.getenv('OPENAI_API_KEY'),
@@ -68,7 +100,7 @@ class LLMConfig:
         )
         
         # Anthropic Claude configuration
-        configs['anthropic-claude'] = ModelConfig(
+        configs['anthropic-claude'] = lambda: ModelConfig(
             provider='anthropic',
             model_name='claude-3-sonnet-20240229',
             api_key=os.getenv('ANTHROPIC_API_KEY'),
@@ -81,13 +113,23 @@ class LLMConfig:
     
     def get_model_config(self, model_name: Optional[str] = None) -> ModelConfig:
         """Get configuration for a specific model"""
-        if model_name is None:
-            model_name = self.default_model
+        if model_name is None or model_name == self.default_model:
+            if self._default_config is None:
+                self._default_config = self._resolve(self.default_model)
+            return self._default_config
         
-        if model_name not in self.models:
-            raise ValueError(f"Model '{model_name}' not found in configuration. Available models: {list(self.models.keys())}")
+        return self._resolve(model_name)
+    
+    def _resolve(self, model_name: str) -> ModelConfig:
+        """Return the memoized configuration for model_name, building it on first use"""
+        config = self._resolved.get(model_name)
+        if config is None:
+            factory = self._factories.get(model_name)
+            if factory is None:
+                raise ValueError(f"Model '{model_name}' not found in configuration. Available models: {list(self._factories.keys())}")
+            config = self._resolved[model_name] = factory()
         
-        return self.models[model_name]
+        return config
     
     def list_available_models(self) -> Dict[str, str]:
         """List all available models with their providers"""
@@ -95,17 +137,28 @@ class LLMConfig:
     
     def add_custom_model(self, name: str, config: ModelConfig):
         """Add a custom model configuration"""
-        self.models[name] = config
+        self._factories[name] = lambda: config
+        self._resolved[name] = config
+        if name == self.default_model:
+            self._default_config = config
     
     def set_default_model(self, model_name: str):
         """Set the default model to use"""
-        if model_name not in self.models:
+        if model_name not in self._factories:
             raise ValueError(f"Model '{model_name}' not found in configuration")
         self.default_model = model_name
+        self._default_config = None
 
-# Global configuration instance
-llm_config = LLMConfig()
+# Global configuration, created on first get_config() call
+_config: Optional[LLMConfig] = None
+_config_lock = threading.Lock()
 
 def get_config() -> LLMConfig:
-    """Get the global LLM configuration instance"""
-    return llm_config
+    """Get the global LLM configuration instance, created on first use"""
+    global _config
+    if _config is None:
+        # Concurrent first callers must all receive the same instance
+        with _config_lock:
+            if _config is None:
+                _config = LLMConfig()
+    return _config
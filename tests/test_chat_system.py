@@ -3,6 +3,7 @@
 Test script for the configurable LLM chat system
 """
 
+import asyncio
 import os
 import sys
 
@@ -11,148 +12,183 @@ src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
 if src_path not in sys.path:
     sys.path.insert(0, src_path)
 
-try:
-    from llm_chat import create_chat_client, get_config  # type: ignore[import-untyped]
-except ImportError:
-    # Fallback for development environment
-    import llm_chat  # type: ignore[import-untyped]
-    create_chat_client = llm_chat.create_chat_client
-    get_config = llm_chat.get_config
+# llm_chat is imported inside each test, so collecting this module stays cheap
+
+def _write_lines(lines):
+    """Write collected output lines to stdout in a single call"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 def test_configuration():
     """Test that configuration is loaded correctly"""
-    print("=== Testing Configuration ===")
+    from llm_chat import get_config  # type: ignore[import-untyped]
+    
+    out = ["\n=== Testing Configuration ==="]
     
     try:
         config = get_config()
-        print(f"✅ Configuration loaded successfully")
-        print(f"Default model: {config.default_model}")
+        out.append(f"✅ Configuration loaded successfully")
+        out.append(f"Default model: {config.default_model}")
         
         available_models = config.list_available_models()
-        print(f"Available models: {list(available_models.keys())}")
+        out.append(f"Available models: {list(available_models.keys())}")
         
         # Test getting model config
         model_config = config.get_model_config()
-        print(f"Default model config: {model_config.provider}/{model_config.model_name}")
+        out.append(f"Default model config: {model_config.provider}/{model_config.model_name}")
         
         return True
     except Exception as e:
-        print(f"❌ Configuration test failed: {e}")
+        out.append(f"❌ Configuration test failed: {e}")
         return False
+    finally:
+        _write_lines(out)
 
 def test_chat_client_creation():
     """Test creating chat clients"""
-    print("\n=== Testing Chat Client Creation ===")
+    from llm_chat import create_chat_client  # type: ignore[import-untyped]
+    
+    out = ["\n=== Testing Chat Client Creation ==="]
     
     try:
         # Test default client
         chat = create_chat_client()
-        print(f"✅ Default chat client created: {chat.model_config.provider}/{chat.model_config.model_name}")
+        out.append(f"✅ Default chat client created: {chat.model_config.provider}/{chat.model_config.model_name}")
         
         # Test specific model client
         chat_abacus = create_chat_client('abacus-gpt5')
-        print(f"✅ Abacus chat client created: {chat_abacus.model_config.provider}/{chat_abacus.model_config.model_name}")
+        out.append(f"✅ Abacus chat client created: {chat_abacus.model_config.provider}/{chat_abacus.model_config.model_name}")
         
         return True
     except Exception as e:
-        print(f"❌ Chat client creation test failed: {e}")
+        out.append(f"❌ Chat client creation test failed: {e}")
         return False
+    finally:
+        _write_lines(out)
 
 def test_message_preparation():
     """Test message preparation without actually sending"""
-    print("\n=== Testing Message Preparation ===")
+    from llm_chat import create_chat_client  # type: ignore[import-untyped]
+    
+    out = ["\n=== Testing Message Preparation ==="]
     
     try:
         chat = create_chat_client()
         
         # Add a test message
         chat.add_message('user', 'Test message')
-        print(f"✅ Message added to history: {len(chat.conversation_history)} messages")
+        out.append(f"✅ Message added to history: {len(chat.conversation_history)} messages")
         
-        # Test attachment processing
-        test_files = []
-        for file_path in ['./data/prompt_v14.txt', './README.md', './config.py']:
-            if os.path.exists(file_path):
-                test_files.append(file_path)
+        # Test attachment processing (one directory scan per folder instead of a stat per file)
+        candidates = ['./data/prompt_v14.txt', './README.md', './config.py']
+        present = {}
+        for directory in {os.path.dirname(path) for path in candidates}:
+            try:
+                with os.scandir(directory) as entries:
+                    present[directory] = {entry.name for entry in entries}
+            except FileNotFoundError:
+                present[directory] = set()
+        test_files = [path for path in candidates
+                      if os.path.basename(path) in present[os.path.dirname(path)]]
         
         if test_files:
             attachments = chat._process_attachments(test_files)
-            print(f"✅ Processed {len(attachments)} attachments from {len(test_files)} files")
+            out.append(f"✅ Processed {len(attachments)} attachments from {len(test_files)} files")
             for att in attachments:
-                print(f"   - {att['filename']} ({att['type']})")
+                out.append(f"   - {att['filename']} ({att['type']})")
         else:
-            print("⚠️  No test files found for attachment processing")
+            out.append("⚠️  No test files found for attachment processing")
         
         return True
     except Exception as e:
-        print(f"❌ Message preparation test failed: {e}")
+        out.append(f"❌ Message preparation test failed: {e}")
         return False
+    finally:
+        _write_lines(out)
 
-def test_environment_variables():
-    """Test that required environment variables are set"""
-    print("\n=== Testing Environment Variables ===")
+def _check_credentials(out):
+    """Append the Abacus credential status to out and return whether the minimum is set"""
+    from llm_chat import get_config  # type: ignore[import-untyped]
     
-    required_vars = {
-        'ABACUS_DEPLOYMENT_ID': os.getenv('ABACUS_DEPLOYMENT_ID'),
-        'ABACUS_DEPLOYMENT_TOKEN': os.getenv('ABACUS_DEPLOYMENT_TOKEN'),
-        'ABACUS_API_KEY': os.getenv('ABACUS_API_KEY')
-    }
+    # Creating the configuration loads .env on first use
+    get_config()
     
-    print("Environment variables status:")
-    for var_name, var_value in required_vars.items():
+    env = os.environ
+    required = ('ABACUS_DEPLOYMENT_ID', 'ABACUS_DEPLOYMENT_TOKEN', 'ABACUS_API_KEY')
+    required_vars = {var_name: env.get(var_name) for var_name in required}
+    
+    out.append("Environment variables status:")
+    for var_name in required:
+        var_value = required_vars[var_name]
         if var_value:
-            print(f"✅ {var_name}: Set (length: {len(var_value)})")
+            out.append(f"✅ {var_name}: Set (length: {len(var_value)})")
         else:
-            print(f"❌ {var_name}: Not set")
+            out.append(f"❌ {var_name}: Not set")
     
     # Check if we have minimum required credentials
     has_auth = bool(required_vars['ABACUS_DEPLOYMENT_TOKEN'] or required_vars['ABACUS_API_KEY'])
     has_deployment = bool(required_vars['ABACUS_DEPLOYMENT_ID'])
     
     if has_auth and has_deployment:
-        print("✅ Minimum required credentials are available")
+        out.append("✅ Minimum required credentials are available")
         return True
     else:
-        print("❌ Missing required credentials for Abacus.AI")
-        print("   Set either ABACUS_DEPLOYMENT_TOKEN or ABACUS_API_KEY")
-        print("   Set ABACUS_DEPLOYMENT_ID")
+        out.append("❌ Missing required credentials for Abacus.AI")
+        out.append("   Set either ABACUS_DEPLOYMENT_TOKEN or ABACUS_API_KEY")
+        out.append("   Set ABACUS_DEPLOYMENT_ID")
         return False
 
+def test_environment_variables():
+    """Test that required environment variables are set"""
+    out = ["\n=== Testing Environment Variables ==="]
+    try:
+        return _check_credentials(out)
+    finally:
+        _write_lines(out)
+
 def test_actual_api_call():
     """Test an actual API call (if credentials are available)"""
-    print("\n=== Testing Actual API Call ===")
-    
-    if not test_environment_variables():
-        print("⚠️  Skipping API test due to missing credentials")
-        return False
+    from llm_chat import create_chat_client  # type: ignore[import-untyped]
     
+    # The whole section, credential check included, is written in one call so
+    # it stays contiguous while the other tests run concurrently
+    out = ["\n=== Testing Actual API Call ==="]
     try:
+        if not _check_credentials(out):
+            out.append("⚠️  Skipping API test due to missing credentials")
+            return False
+        
         chat = create_chat_client('abacus-gpt5')
         
-        print("Sending test message to Abacus.AI...")
+        out.append("Sending test message to Abacus.AI...")
         response = chat.send_message(
             message="Hello! Please respond with just 'Hello back!' to confirm the connection is working.",
             include_history=False
         )
         
-        print(f"✅ API call successful!")
-        print(f"Model: {response.model} ({response.provider})")
-        print(f"Response length: {len(response.content)} characters")
-        print(f"Response preview: {response.content[:100]}...")
+        out.append(f"✅ API call successful!")
+        out.append(f"Model: {response.model} ({response.provider})")
+        out.append(f"Response length: {len(response.content)} characters")
+        out.append(f"Response preview: {response.content[:100]}...")
         
         return True
     except Exception as e:
-        print(f"❌ API call test failed: {e}")
-        print("This might be due to:")
-        print("  - Invalid credentials")
-        print("  - Network connectivity issues")
-        print("  - Abacus.AI service unavailable")
+        out.append(f"❌ API call test failed: {e}")
+        out.append("This might be due to:")
+        out.append("  - Invalid credentials")
+        out.append("  - Network connectivity issues")
+        out.append("  - Abacus.AI service unavailable")
         return False
+    finally:
+        _write_lines(out)
+
+async def _run_tests(tests):
+    """Run the tests concurrently in worker threads, returning results in test order"""
+    return await asyncio.gather(*(asyncio.to_thread(test_func) for test_func in tests))
 
 def main():
     """Run all tests"""
-    print("LLM Chat System Test Suite")
-    print("=" * 50)
+    out = ["LLM Chat System Test Suite", "=" * 50]
     
     tests = [
         test_configuration,
@@ -164,31 +200,28 @@ def main():
     # Only run API test if user confirms
     if len(sys.argv) > 1 and sys.argv[1] == '--include-api':
         tests.append(test_actual_api_call)
-        print("Note: Including actual API test (may use credits)")
+        out.append("Note: Including actual API test (may use credits)")
     else:
-        print("Note: Skipping actual API test. Use --include-api to test API calls")
+        out.append("Note: Skipping actual API test. Use --include-api to test API calls")
     
-    print()
+    _write_lines(out)
     
-    results = []
-    for test_func in tests:
-        result = test_func()
-        results.append(result)
+    results = asyncio.run(_run_tests(tests))
     
-    print("\n" + "=" * 50)
-    print("Test Results Summary:")
     passed = sum(results)
     total = len(results)
-    print(f"Passed: {passed}/{total}")
+    out = ["\n" + "=" * 50, "Test Results Summary:", f"Passed: {passed}/{total}"]
     
     if passed == total:
-        print("🎉 All tests passed! The system is ready to use.")
+        out.append("🎉 All tests passed! The system is ready to use.")
     else:
-        print("⚠️  Some tests failed. Check the output above for details.")
-        print("\nCommon issues:")
-        print("- Missing environment variables (copy .env.example to .env)")
-        print("- Invalid Abacus.AI credentials")
-        print("- Missing data files")
+        out.append("⚠️  Some tests failed. Check the output above for details.")
+        out.append("\nCommon issues:")
+        out.append("- Missing environment variables (copy .env.example to .env)")
+        out.append("- Invalid Abacus.AI credentials")
+        out.append("- Missing data files")
+    
+    _write_lines(out)
     
     return passed == total
 
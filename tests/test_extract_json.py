@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests for the bracket repair used by scripts/extract_json.py
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+# Add scripts directory to Python path so the script can be imported as a module
+scripts_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+if scripts_path not in sys.path:
+    sys.path.insert(0, scripts_path)
+
+from extract_json import _dump_json_bytes, _repair_brackets, _tolerant_json_load  # noqa: E402
+
+def test_array_closed_by_brace_is_repaired():
+    """The timeline_of_events case: an array closed with '}' instead of ']'"""
+    content = '{"timeline_of_events": [{"date": "2024-01-01"}, {"date": "2024-02-01"}}, "summary": "ok"}'
+
+    assert _repair_brackets(content) == (
+        '{"timeline_of_events": [{"date": "2024-01-01"}, {"date": "2024-02-01"}], "summary": "ok"}'
+    )
+    assert _tolerant_json_load(content) == {
+        'timeline_of_events': [{'date': '2024-01-01'}, {'date': '2024-02-01'}],
+        'summary': 'ok'
+    }
+
+def test_brackets_inside_strings_are_left_alone():
+    """Brackets and escaped quotes inside string values are not treated as structure"""
+    content = '{"note": "see [ref} and {x]", "quote": "a \\"[\\" b", "items": [1, 2}}'
+
+    data = _tolerant_json_load(content)
+
+    assert data == {'note': 'see [ref} and {x]', 'quote': 'a "[" b', 'items': [1, 2]}
+
+def test_missing_trailing_closers_are_appended():
+    """A truncated document gets its open containers closed in order"""
+    content = '{"a": {"b": [1, 2'
+
+    assert _repair_brackets(content) == '{"a": {"b": [1, 2]}}'
+    assert _tolerant_json_load(content) == {'a': {'b': [1, 2]}}
+
+def test_valid_json_is_returned_unchanged():
+    """Well-formed input parses on the first attempt"""
+    content = '{"a": [1, {"b": "]"}]}'
+
+    assert _repair_brackets(content) == content
+    assert _tolerant_json_load(content) == {'a': [1, {'b': ']'}]}
+
+def test_unrepairable_input_reraises_original_error():
+    """When the repair does not yield valid JSON, the first parse error is raised"""
+    content = '{"a": [1,, 2}'
+
+    with pytest.raises(json.JSONDecodeError) as original:
+        json.loads(content)
+    with pytest.raises(json.JSONDecodeError) as raised:
+        _tolerant_json_load(content)
+
+    assert raised.value.pos == original.value.pos
+
+def test_input_without_bracket_errors_reraises():
+    """Errors unrelated to brackets are raised without a retry"""
+    content = '{"a": 1,,}'
+
+    assert _repair_brackets(content) == content
+    with pytest.raises(json.JSONDecodeError):
+        _tolerant_json_load(content)
+
+def test_wide_integers_and_non_finite_values_match_stdlib():
+    """Integers beyond 64 bits and NaN/Infinity parse and re-serialize exactly as stdlib json does"""
+    content = '{"id": 123456789012345678901234567890, "score": NaN, "limit": -Infinity}'
+
+    data = _tolerant_json_load(content)
+
+    assert data['id'] == 123456789012345678901234567890
+    assert isinstance(data['id'], int)
+    assert _dump_json_bytes(data) == json.dumps(json.loads(content), indent=2).encode('utf-8')